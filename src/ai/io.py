@@ -1,25 +1,24 @@
+_MISSING = object()
 
-from collections import OrderedDict
 
 class LRUCache:
     def __init__(self, capacity: int):
-        self.cache = OrderedDict()
+        # Plain dicts preserve insertion order, so the first key is always the LRU entry
+        self.cache: dict = {}
         self.capacity = capacity
 
     def get(self, key):
-        if key in self.cache:
-            return self.cache[key]
-        else:
+        value = self.cache.pop(key, _MISSING)
+        if value is _MISSING:
             return None
+        # Re-insert to promote the entry to most recently used
+        self.cache[key] = value
+        return value
 
     def set(self, key, value):
-        if key in self.cache:
-            # Update existing
-            self.cache[key] = value
-            self.cache.move_to_end(key)
-        else:
-            # Add new
-            if len(self.cache) >= self.capacity:
-                # Remove least recently used
-                self.cache.popitem(last=False)
-            self.cache[key] = value
+        # Drop any existing entry so the re-insert moves it to the end
+        self.cache.pop(key, None)
+        self.cache[key] = value
+        if len(self.cache) > self.capacity:
+            # Remove least recently used
+            del self.cache[next(iter(self.cache))]
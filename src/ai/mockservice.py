@@ -1,14 +1,59 @@
 
-from typing import Dict, Any
+from typing import Dict, Any, NamedTuple, Tuple
+from collections import deque
 from dataclasses import dataclass
 import logging
 from src.models.schemas import MatchResponse
-from src.salesforce.salesforce import SalesForceService
+from src.salesforce.salesforce import SalesForceService, prewarm_enrichment
 from src.ai.io import LRUCache
 from src.exceptions import ValidationError, ProcessingError, AIServiceError, CacheError
 logger = logging.getLogger(__name__)
 
-@dataclass
+
+class FieldState(NamedTuple):
+    """Validation state tracked for a single field in ai_state."""
+    status: str
+    reason: str
+    value: str
+
+
+# Sentinel for fields that have no tracked state yet
+_EMPTY = FieldState("", "", "")
+
+# Placeholder values that do not identify a real manufacturer or model
+_GENERIC_MFRS = frozenset({"to be determined", "unknown"})
+_GENERIC_MODELS = frozenset({"450", "500", "600", "1000", "2000", "generator"})
+
+# Manufacturer-specific "match found" explanations, formatted with model_number and product_line
+_EXPLANATION_TEMPLATES = {
+    "cummins": "The model number '{model_number}' corresponds to the '{product_line}' product line, a diesel generator set manufactured by Cummins. The '{product_line}' model is part of Cummins' 60Hz diesel generator offerings with robust performance specifications. This information is sourced from Cummins' official product documentation.",
+    "caterpillar": "The model number '{model_number}' identifies a Caterpillar '{product_line}' series generator. This model is part of Caterpillar's industrial generator lineup known for reliability and performance in demanding applications.",
+    "kohler": "The model number '{model_number}' represents a Kohler '{product_line}' series generator, part of their commercial and industrial power generation portfolio."
+}
+_DEFAULT_EXPLANATION_TEMPLATE = "The model number '{model_number}' has been matched to the '{product_line}' product line based on manufacturer specifications and industry standard naming conventions."
+
+
+@dataclass(slots=True)
+class ValidationStates:
+    """Fixed-shape container for the FieldState of every tracked field."""
+    manufacturer: FieldState = _EMPTY
+    model_number: FieldState = _EMPTY
+    asset_classification: FieldState = _EMPTY
+    product_line: FieldState = _EMPTY
+    explanation: FieldState = _EMPTY
+
+    def clear(self) -> None:
+        """Reset every field back to the empty sentinel."""
+        for field_name in _STATE_FIELDS:
+            setattr(self, field_name, _EMPTY)
+
+
+_STATE_FIELDS = tuple(ValidationStates.__dataclass_fields__)
+# Fields that hold validation results; "explanation" is generated output, not a validation
+_VALIDATED_FIELDS = ("manufacturer", "model_number", "asset_classification", "product_line")
+
+
+@dataclass(slots=True)
 class MockResponse:
     # Response fields (matching MatchResponse schema)
     asset_classification: str = ""
@@ -18,48 +63,60 @@ class MockResponse:
     model_number: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class AssetProcessingResult(MockResponse):
-    ai_state: dict = None
+    ai_state: ValidationStates = None
 
     def __post_init__(self):
         if self.ai_state is None:
-            self.ai_state = {}
+            self.ai_state = ValidationStates()
 
-    def update_ai_state(self, ai_state: Dict[str, Any]) -> None:
+    def update_ai_state(self, ai_state: ValidationStates) -> None:
         self.ai_state = ai_state
 
-    def get_ai_state(self) -> Dict[str, Any]:
+    def get_ai_state(self) -> ValidationStates:
         return self.ai_state
 
     def clear_ai_state(self) -> None:
-        self.ai_state = {}
+        self.ai_state = ValidationStates()
 
     def insert_state(self, field_name: str, status: str, reason: str = "", value: str = '') -> None:
         """Insert validation state for a field.
         
         Args:
-            field_name: Name of the field being validated
+            field_name: Name of the field being validated (one of the ValidationStates fields)
             status: Validation status ("ok", "invalid", "generic", "missing")
             reason: Description of the validation result
             value: The actual value being tracked/extracted
         """
-        self.ai_state[field_name] = {
-            "status": status,
-            "reason": reason,
-            "value": value
-        }
+        setattr(self.ai_state, field_name, FieldState(status, reason, value))
+
+    def get_state_value(self, field_name: str, default: str = "") -> str:
+        """Return the tracked value for a field, or default if the field has no state yet."""
+        state = getattr(self.ai_state, field_name)
+        return default if state is _EMPTY else state.value
 
-    def get_failed_validations(self) -> Dict[str, Dict[str, str]]:
+    def get_failed_validations(self) -> Dict[str, FieldState]:
         """Return all fields that failed validation (status != 'ok')"""
-        return {
-            field: state for field, state in self.ai_state.items() 
-            if state.get("status") != "ok"
-        }
+        states = self.ai_state
+        failed = {}
+        for field in _VALIDATED_FIELDS:
+            state = getattr(states, field)
+            if state is not _EMPTY and state.status != "ok":
+                failed[field] = state
+        return failed
 
     def is_valid(self) -> bool:
-        """Check if all tracked fields passed validation"""
-        return len(self.get_failed_validations()) == 0
+        """Check if all tracked fields passed validation.
+
+        The generated "explanation" entry is not a validation result and is skipped.
+        """
+        states = self.ai_state
+        for field in _VALIDATED_FIELDS:
+            state = getattr(states, field)
+            if state is not _EMPTY and state.status != "ok":
+                return False
+        return True
 
     def generate_explanation(self) -> str:
         """Generate explanation based on validation results and product line detection.
@@ -68,24 +125,15 @@ class AssetProcessingResult(MockResponse):
             String explanation of the processing results
         """
         # Get values from ai_state where they're stored by validation functions
-        manufacturer = self.ai_state.get("manufacturer", {}).get("value", "")
-        model_number = self.ai_state.get("model_number", {}).get("value", "")
-        product_line = self.ai_state.get("product_line", {}).get("value", "")
+        manufacturer = self.ai_state.manufacturer.value
+        model_number = self.ai_state.model_number.value
+        product_line = self.ai_state.product_line.value
         
         # Check if validation passed and product line found
         if self.is_valid() and product_line:
             # Generate manufacturer-specific "match found" explanation
-            explanations = {
-                "cummins": f"The model number '{model_number}' corresponds to the '{product_line}' product line, a diesel generator set manufactured by Cummins. The '{product_line}' model is part of Cummins' 60Hz diesel generator offerings with robust performance specifications. This information is sourced from Cummins' official product documentation.",
-                "caterpillar": f"The model number '{model_number}' identifies a Caterpillar '{product_line}' series generator. This model is part of Caterpillar's industrial generator lineup known for reliability and performance in demanding applications.",
-                "kohler": f"The model number '{model_number}' represents a Kohler '{product_line}' series generator, part of their commercial and industrial power generation portfolio."
-            }
-            
-            manufacturer_lower = manufacturer.lower()
-            explanation = explanations.get(
-                manufacturer_lower,
-                f"The model number '{model_number}' has been matched to the '{product_line}' product line based on manufacturer specifications and industry standard naming conventions."
-            )
+            template = _EXPLANATION_TEMPLATES.get(_normalize(manufacturer), _DEFAULT_EXPLANATION_TEMPLATE)
+            explanation = template.format(model_number=model_number, product_line=product_line)
         else:
             # Generate "needs more specific data" explanation
             failed_validations = self.get_failed_validations()
@@ -96,11 +144,9 @@ class AssetProcessingResult(MockResponse):
                 explanation = f"Valid data provided but no specific product line match could be determined for model '{model_number}'."
         
         # Store explanation in ai_state
-        self.ai_state["explanation"] = {
-            "status": "generated",
-            "reason": "Explanation generated based on processing results",
-            "value": explanation
-        }
+        self.ai_state.explanation = FieldState(
+            "generated", "Explanation generated based on processing results", explanation
+        )
         
         return explanation
 
@@ -108,16 +154,16 @@ class AssetProcessingResult(MockResponse):
         """Update ai_state with enriched data from Salesforce.
         
         Args:
-            enriched_data: Dictionary of enriched data from SalesForceService
+            enriched_data: Dictionary of Enrichment results from SalesForceService
         """
         for field_name, enrichment in enriched_data.items():
-            if field_name in self.ai_state:
+            if getattr(self.ai_state, field_name, _EMPTY) is not _EMPTY:
                 # Update the field with enriched value
-                self.ai_state[field_name] = {
-                    "status": "ok",
-                    "reason": f"Enriched via Salesforce: {enrichment.get('source', 'Unknown')}",
-                    "value": enrichment.get("enhanced_value", "")
-                }
+                setattr(self.ai_state, field_name, FieldState(
+                    "ok",
+                    f"Enriched via Salesforce: {enrichment.source}",
+                    enrichment.enhanced_value
+                ))
 
     def create_match_response(self, original_input: Dict[str, Any]) -> MatchResponse:
         """Create match response based on validation results and product line detection.
@@ -129,13 +175,14 @@ class AssetProcessingResult(MockResponse):
             MatchResponse object with validation results and product line detection
         """
         # Extract values from ai_state, using original input as fallback
-        asset_classification = self.ai_state.get("asset_classification", {}).get("value", original_input.get("asset_classification_name", ""))
-        manufacturer = self.ai_state.get("manufacturer", {}).get("value", original_input.get("manufacturer_name", ""))
-        model_number = self.ai_state.get("model_number", {}).get("value", original_input.get("model_number", ""))
-        product_line = self.ai_state.get("product_line", {}).get("value", "")
-        explanation = self.ai_state.get("explanation", {}).get("value", "")
-
-        return MatchResponse(
+        asset_classification = self.get_state_value("asset_classification", original_input.get("asset_classification_name", ""))
+        manufacturer = self.get_state_value("manufacturer", original_input.get("manufacturer_name", ""))
+        model_number = self.get_state_value("model_number", original_input.get("model_number", ""))
+        product_line = self.ai_state.product_line.value
+        explanation = self.ai_state.explanation.value
+
+        # Values come from trusted internal state, so skip pydantic re-validation
+        return MatchResponse.model_construct(
             asset_classification=asset_classification,
             manufacturer=manufacturer,
             model_number=model_number,
@@ -146,9 +193,16 @@ class AssetProcessingResult(MockResponse):
 
 
 class MockService:
-    def __init__(self, cache_size: int = 100):
+    def __init__(self, cache_size: int = 100, pool_size: int = 64):
         # Initialize LRU cache for response caching (cost optimization)
         self.response_cache = LRUCache(cache_size)
+
+        # Long-lived Salesforce client reused for every enrichment instead of one per request
+        self._salesforce = SalesForceService()
+        prewarm_enrichment()
+
+        # Bounded pool of scratch AssetProcessingResult objects reused by match()
+        self._pool: deque = deque(maxlen=pool_size)
         
         self.known_patterns = {
             "cummins": {
@@ -171,98 +225,169 @@ class MockService:
             }
         }
 
+        # Precompile patterns into (order, pattern, product_line) tuples bucketed by first character,
+        # so product line detection only scans patterns that can start somewhere in the model number
+        self._patterns_by_mfr_by_char: Dict[str, Dict[str, tuple]] = {}
+        for manufacturer, patterns in self.known_patterns.items():
+            buckets: Dict[str, list] = {}
+            for order, (pattern, product_line) in enumerate(patterns.items()):
+                buckets.setdefault(pattern[0], []).append((order, pattern, product_line))
+            self._patterns_by_mfr_by_char[manufacturer] = {
+                char: tuple(bucket) for char, bucket in buckets.items()
+            }
 
 
-    def process_asset_data(self, asset_data: Dict[str, Any]) -> AssetProcessingResult:
-        """Process asset data through validation and return AssetProcessingResult with results.
+
+    def match(self, asset_data: Dict[str, Any]) -> MatchResponse:
+        """Process asset data and return the final MatchResponse.
         Cost optimization: Uses LRU cache to avoid reprocessing identical inputs.
-        
+
+        Only the immutable MatchResponse is cached, so callers can never mutate
+        a cached entry through a shared AssetProcessingResult. Inputs missing a
+        manufacturer or model number bypass the cache so they cannot evict useful entries.
+
         Args:
             asset_data: Dictionary containing asset information
-            
+
         Returns:
-            AssetProcessingResult instance with validation results tracked
+            MatchResponse for the given asset data
         """
+        cache_key = _create_cache_key(asset_data)
+        _, manufacturer_norm, model_norm = cache_key
+        cacheable = bool(manufacturer_norm and model_norm)
+
         # Cost Optimization: Check cache first
-        try:
-            cache_key = _create_cache_key(asset_data)
+        if cacheable:
             cached_response = self.response_cache.get(cache_key)
             
             if cached_response:
-                logging.info(f"Cache hit for {cache_key} - returning cached response (cost savings!)")
+                logger.info("Cache hit for %s - returning cached response (cost savings!)", cache_key)
                 return cached_response
             
-            logging.info(f"Cache miss for {cache_key} - processing new request")
-        except Exception as e:
-            # Log cache error but continue processing
-            logging.warning(f"Cache operation failed: {e}. Continuing without cache.")
-            cache_key = None
+            logger.info("Cache miss for %s - processing new request", cache_key)
+
+        state = self._acquire_state()
+        try:
+            self._run_pipeline(asset_data, state, normalized=cache_key)
+            response = state.create_match_response(asset_data)
+        finally:
+            # The response holds no reference to state, so it is safe to recycle
+            self._release_state(state)
+
+        # Cost Optimization: Cache the final response
+        if cacheable:
+            self.response_cache.set(cache_key, response)
+            logger.info("Cached response for %s", cache_key)
+
+        return response
+
+    def process_asset_data(self, asset_data: Dict[str, Any]) -> AssetProcessingResult:
+        """Process asset data through validation and return AssetProcessingResult with results.
+
+        Use match() to get the MatchResponse; this keeps the full per-field state for inspection.
         
+        Args:
+            asset_data: Dictionary containing asset information
+            
+        Returns:
+            AssetProcessingResult instance with validation results tracked
+        """
         state = AssetProcessingResult()
+        self._run_pipeline(asset_data, state)
+        return state
+
+    def _acquire_state(self) -> AssetProcessingResult:
+        """Take a cleared AssetProcessingResult from the pool, or allocate a new one."""
+        try:
+            # deque.pop is atomic, so concurrent workers never receive the same object
+            return self._pool.pop()
+        except IndexError:
+            return AssetProcessingResult()
 
+    def _release_state(self, state: AssetProcessingResult) -> None:
+        """Clear state and return it to the pool; the bounded deque drops extras."""
+        state.ai_state.clear()
+        self._pool.append(state)
+
+    def _run_pipeline(self, asset_data: Dict[str, Any], state: AssetProcessingResult,
+                      normalized: Tuple[str, str, str] = None) -> None:
+        """Run validation, product line detection and enrichment into state.
+
+        Args:
+            asset_data: Dictionary containing asset information
+            state: AssetProcessingResult to populate
+            normalized: Pre-normalized (classification, manufacturer, model_number) as
+                returned by _create_cache_key; computed here when not supplied
+        """
         asset_classification = asset_data.get("asset_classification_name", "")
         manufacturer = asset_data.get("manufacturer_name", "")
         model_number = asset_data.get("model_number", "")
 
-        # Run validations and track results in aistate
-        check_manufacturer(manufacturer, state)
-        check_model_number(model_number, state)
-        check_asset_classification(asset_classification, state)
-        self._get_product_line(manufacturer, model_number, state)
+        # One normalization pass per request, shared by validators and product line detection
+        if normalized is None:
+            normalized = (_normalize(asset_classification), _normalize(manufacturer), _normalize(model_number))
+        classification_norm, manufacturer_norm, model_norm = normalized
+
+        # Validators are pure and independent, so collect every result before updating aistate
+        validations = (
+            ("manufacturer", _validate_manufacturer(manufacturer, manufacturer_norm)),
+            ("model_number", _validate_model_number(model_number, model_norm)),
+            ("asset_classification", _validate_asset_classification(asset_classification, classification_norm)),
+        )
+        for field_name, (status, reason, value) in validations:
+            state.insert_state(field_name, status, reason, value=value)
+        self._get_product_line(manufacturer, model_number, state, manufacturer_norm, model_norm)
 
         if state.is_valid():
-            logging.info(f"Processing asset {state.model_number} is valid")
+            logger.info("Processing asset %s is valid", state.model_number)
             # Generate explanation for successful processing
             explanation = state.generate_explanation()
-            logging.info(f"Processing successful: {explanation}")
+            logger.info("Processing successful: %s", explanation)
         else:
-            logging.info(f"Processing asset {state.model_number} is invalid")
+            logger.info("Processing asset %s is invalid", state.model_number)
             failed_validations = state.get_failed_validations()
-            salesforce = SalesForceService(failed_validations)
-            enrichment_result = salesforce.enrich_failed_validations()
+            enrichment_result = self._salesforce.enrich_failed_validations(failed_validations)
             
             # Let AssetProcessingResult update itself with enriched data
             state.update_with_enriched_data(enrichment_result["enriched_data"])
             
             # Re-run product line detection with enriched data
-            enriched_manufacturer = state.ai_state.get("manufacturer", {}).get("value", manufacturer)
-            enriched_model_number = state.ai_state.get("model_number", {}).get("value", model_number)
+            enriched_manufacturer = state.get_state_value("manufacturer", manufacturer)
+            enriched_model_number = state.get_state_value("model_number", model_number)
             self._get_product_line(enriched_manufacturer, enriched_model_number, state)
             
             # Generate final explanation with enriched data
             explanation = state.generate_explanation()
-            logging.info(f"After enrichment: {explanation}")
-
-        # Cost Optimization: Cache the processed result
-        if cache_key:
-            try:
-                self.response_cache.set(cache_key, state)
-                logging.info(f"Cached response for {cache_key}")
-            except Exception as e:
-                logging.warning(f"Failed to cache response: {e}")
-
-        return state
+            logger.info("After enrichment: %s", explanation)
 
 
 
-    def _get_product_line(self, manufacturer_name: str, model_number: str, ai_state: AssetProcessingResult) -> None:
+    def _get_product_line(self, manufacturer_name: str, model_number: str, ai_state: AssetProcessingResult,
+                          manufacturer_norm: str = None, model_norm: str = None) -> None:
         """Detect product line from manufacturer and model number, update processing result.
         
         Args:
             manufacturer_name: The manufacturer name
             model_number: The model number to analyze
             ai_state: AssetProcessingResult instance to track product line results
+            manufacturer_norm: Normalized manufacturer name, computed when not supplied
+            model_norm: Normalized model number, computed when not supplied
         """
-        manufacturer_lower = manufacturer_name.lower()
-        model_lower = model_number.lower()
-
-        # Check known manufacturer patterns
-        if manufacturer_lower in self.known_patterns:
-            patterns = self.known_patterns[manufacturer_lower]
-            for pattern, product_line in patterns.items():
-                if pattern in model_lower:
-                    ai_state.insert_state("product_line", "ok", f"Found product line '{product_line}' from pattern '{pattern}'", value=product_line)
-                    return
+        manufacturer_lower = _normalize(manufacturer_name) if manufacturer_norm is None else manufacturer_norm
+        model_lower = _normalize(model_number) if model_norm is None else model_norm
+
+        # Check known manufacturer patterns, keeping the earliest-declared pattern on multiple hits
+        buckets = self._patterns_by_mfr_by_char.get(manufacturer_lower)
+        if buckets:
+            best = None
+            for char in set(model_lower):
+                for candidate in buckets.get(char, ()):
+                    if (best is None or candidate[0] < best[0]) and candidate[1] in model_lower:
+                        best = candidate
+            if best is not None:
+                _, pattern, product_line = best
+                ai_state.insert_state("product_line", "ok", f"Found product line '{product_line}' from pattern '{pattern}'", value=product_line)
+                return
 
         # Fallback: extract potential product line from model number prefix
         if len(model_number) > 3:
@@ -275,6 +400,69 @@ class MockService:
         ai_state.insert_state("product_line", "not_found", "No specific product line match found", value="")
 
 
+def _normalize(value: str) -> str:
+    """Strip and lowercase a raw input field, treating None as empty."""
+    return value.strip().lower() if value else ""
+
+def _validate_manufacturer(manufacturer: str, manufacturer_norm: str) -> Tuple[str, str, str]:
+    """Validate a manufacturer name without touching any processing state.
+
+    Args:
+        manufacturer: The manufacturer name to validate
+        manufacturer_norm: The manufacturer name after _normalize
+
+    Returns:
+        Tuple of (status, reason, value) for the manufacturer field
+    """
+    if not manufacturer_norm:
+        return "missing", "Manufacturer is empty or missing", ""
+    
+    if manufacturer_norm in _GENERIC_MFRS:
+        return "generic", "Manufacturer is generic placeholder", manufacturer
+    
+    return "ok", "Valid manufacturer provided", manufacturer
+
+def _validate_asset_classification(asset_classification: str, classification_norm: str) -> Tuple[str, str, str]:
+    """Validate an asset classification without touching any processing state.
+
+    Args:
+        asset_classification: The asset classification to validate
+        classification_norm: The asset classification after _normalize
+
+    Returns:
+        Tuple of (status, reason, value) for the asset_classification field
+    """
+    if not classification_norm:
+        return "missing", "Asset classification is empty or missing", ""
+    
+    if len(classification_norm) < 3:
+        return "invalid", "Asset classification too short (minimum 3 characters)", asset_classification
+    
+    return "ok", "Valid asset classification provided", asset_classification
+
+def _validate_model_number(model_number: str, model_norm: str) -> Tuple[str, str, str]:
+    """Validate a model number without touching any processing state.
+
+    Args:
+        model_number: The model number to validate
+        model_norm: The model number after _normalize
+
+    Returns:
+        Tuple of (status, reason, value) for the model_number field
+    """
+    if not model_norm:
+        return "missing", "Model number is empty or missing", ""
+    
+    if len(model_norm) < 3:
+        return "invalid", "Model number too short (minimum 3 characters)", model_number
+
+    # Check for overly generic model numbers
+    if model_norm in _GENERIC_MODELS:
+        return "generic", f"Model number '{model_number}' is too generic", model_number
+
+    return "ok", "Valid model number provided", model_number
+
+
 def check_manufacturer(manufacturer: str, ai_state: AssetProcessingResult) -> None:
     """Check if manufacturer is valid and track validation state.
     
@@ -282,15 +470,8 @@ def check_manufacturer(manufacturer: str, ai_state: AssetProcessingResult) -> No
         manufacturer: The manufacturer name to validate
         ai_state: AssetProcessingResult instance to track validation results
     """
-    if not manufacturer or not manufacturer.strip():
-        ai_state.insert_state("manufacturer", "missing", "Manufacturer is empty or missing", value="")
-        return
-    
-    if manufacturer.lower().strip() in ['to be determined', 'unknown']:
-        ai_state.insert_state("manufacturer", "generic", "Manufacturer is generic placeholder", value=manufacturer)
-        return
-    
-    ai_state.insert_state("manufacturer", "ok", "Valid manufacturer provided", value=manufacturer)
+    status, reason, value = _validate_manufacturer(manufacturer, _normalize(manufacturer))
+    ai_state.insert_state("manufacturer", status, reason, value=value)
 
 def check_asset_classification(asset_classification: str, ai_state: AssetProcessingResult) -> None:
     """Check if asset classification is valid and track validation state.
@@ -299,15 +480,8 @@ def check_asset_classification(asset_classification: str, ai_state: AssetProcess
         asset_classification: The asset classification to validate
         ai_state: AssetProcessingResult instance to track validation results
     """
-    if not asset_classification or not asset_classification.strip():
-        ai_state.insert_state("asset_classification", "missing", "Asset classification is empty or missing", value="")
-        return
-    
-    if len(asset_classification.strip()) < 3:
-        ai_state.insert_state("asset_classification", "invalid", "Asset classification too short (minimum 3 characters)", value=asset_classification)
-        return
-    
-    ai_state.insert_state("asset_classification", "ok", "Valid asset classification provided", value=asset_classification)
+    status, reason, value = _validate_asset_classification(asset_classification, _normalize(asset_classification))
+    ai_state.insert_state("asset_classification", status, reason, value=value)
 
 
 def check_model_number(model_number: str, ai_state: AssetProcessingResult) -> None:
@@ -317,34 +491,21 @@ def check_model_number(model_number: str, ai_state: AssetProcessingResult) -> No
         model_number: The model number to validate
         ai_state: AssetProcessingResult instance to track validation results
     """
-    if not model_number or not model_number.strip():
-        ai_state.insert_state("model_number", "missing", "Model number is empty or missing", value="")
-        return
-    
-    if len(model_number.strip()) < 3:
-        ai_state.insert_state("model_number", "invalid", "Model number too short (minimum 3 characters)", value=model_number)
-        return
-
-    # Check for overly generic model numbers
-    generic_patterns = ["450", "500", "600", "1000", "2000", "generator"]
-    if model_number.lower().strip() in generic_patterns:
-        ai_state.insert_state("model_number", "generic", f"Model number '{model_number}' is too generic", value=model_number)
-        return
-
-    ai_state.insert_state("model_number", "ok", "Valid model number provided", value=model_number)
+    status, reason, value = _validate_model_number(model_number, _normalize(model_number))
+    ai_state.insert_state("model_number", status, reason, value=value)
 
-def _create_cache_key(asset_data: Dict[str, Any]) -> str:
+def _create_cache_key(asset_data: Dict[str, Any]) -> Tuple[str, str, str]:
     """Create a cache key from asset data for response caching.
 
     Args:
         asset_data: Dictionary containing asset information
 
     Returns:
-        String cache key
+        Tuple cache key of the normalized classification, manufacturer and model number
     """
-    # Create deterministic cache key from input data
-    asset_classification = asset_data.get("asset_classification_name", "").strip().lower()
-    manufacturer = asset_data.get("manufacturer_name", "").strip().lower()
-    model_number = asset_data.get("model_number", "").strip().lower()
-
-    return f"{asset_classification}|{manufacturer}|{model_number}"
\ No newline at end of file
+    # Create deterministic cache key from input data, normalized exactly as the validators see it
+    return (
+        _normalize(asset_data.get("asset_classification_name", "")),
+        _normalize(asset_data.get("manufacturer_name", "")),
+        _normalize(asset_data.get("model_number", "")),
+    )
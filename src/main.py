@@ -97,14 +97,18 @@ async def match_asset(request: MatchRequest):
     """
     try:
         # Process the request through the mock AI service
-        logger.info(f"Processing asset match request for manufacturer: {request.manufacturer_name}")
+        logger.info("Processing asset match request for manufacturer: %s", request.manufacturer_name)
         
-        ai_response = ai_service.process_asset_data(request.model_dump())
+        # Build the asset dict directly from the known schema instead of a generic model_dump()
+        asset_data = {
+            "asset_classification_guid2": request.asset_classification_guid2,
+            "asset_classification_name": request.asset_classification_name,
+            "manufacturer_name": request.manufacturer_name,
+            "model_number": request.model_number,
+        }
+        response = ai_service.match(asset_data)
         
-        # Use the create_match_response method
-        response = ai_response.create_match_response(request.model_dump())
-        
-        logger.info(f"Successfully processed asset match request")
+        logger.info("Successfully processed asset match request")
         return response
 
     except SalesforceAIBridgeException:
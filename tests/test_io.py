@@ -0,0 +1,37 @@
+from src.ai.io import LRUCache
+
+
+def test_get_promotes_entry():
+    """Test a get makes the entry most recently used so the other one is evicted"""
+    cache = LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_set_existing_key_promotes_entry():
+    """Test overwriting a key refreshes it instead of keeping its old position"""
+    cache = LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 10)
+
+    cache.set("c", 3)
+
+    assert list(cache.cache) == ["a", "c"]
+    assert cache.get("a") == 10
+
+
+def test_capacity_zero_stores_nothing():
+    """Test a zero-capacity cache never retains an entry"""
+    cache = LRUCache(0)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+    assert len(cache.cache) == 0
@@ -1,5 +1,15 @@
 import pytest
 
+from src.ai.mockservice import (
+    AssetProcessingResult,
+    MockService,
+    ValidationStates,
+    check_asset_classification,
+    check_manufacturer,
+    check_model_number,
+)
+from src.models.schemas import MatchResponse
+
 @pytest.fixture
 def mock_input_good():
     return {
@@ -29,7 +39,6 @@ def test_generic_test(mock_input_good):
 def test_manufacturer_test(mock_input_good):
     manufacturer_name =  mock_input_good['manufacturer_name']
     model_number = mock_input_good['model_number']
-    from src.ai.mockservice import MockService
     service = MockService()
     # Note: _validate_input_schema method doesn't exist in MockAIService
     # This test needs to be updated to use actual methods
@@ -40,276 +49,149 @@ def test_manufacturer_test(mock_input_good):
 
 def test_mock_service(mock_input_good):
 
-    from src.ai.mockservice import MockService
     service = MockService()
     service.process_asset_data(mock_input_good)
 
-def test_manufacturer_validation():
-    """Test manufacturer validation with comprehensive edge cases"""
-    from src.ai.mockservice import check_manufacturer, AssetProcessingResult
-    
+@pytest.mark.parametrize("manufacturer,expected", [
     # Valid manufacturers
-    test_data = {"asset_classification_guid2": "AC123", "asset_classification_name": "Test", "manufacturer_name": "Test", "model_number": "Test"}
-    
-    state = AssetProcessingResult(**test_data)
-    check_manufacturer("Cummins", state)
-    assert state.ai_state["manufacturer"]["status"] == "ok"
-    
-    state = AssetProcessingResult(**test_data)
-    check_manufacturer("Caterpillar", state)
-    assert state.ai_state["manufacturer"]["status"] == "ok"
-    
-    state = AssetProcessingResult(**test_data)
-    check_manufacturer("Kohler", state)
-    assert state.ai_state["manufacturer"]["status"] == "ok"
-    
-    state = AssetProcessingResult(**test_data)
-    check_manufacturer("Generac", state)
-    assert state.ai_state["manufacturer"]["status"] == "ok"
-    
-    state = AssetProcessingResult(**test_data)
-    check_manufacturer("Custom Manufacturer Inc.", state)
-    assert state.ai_state["manufacturer"]["status"] == "ok"
-    
+    ("Cummins", "ok"),
+    ("Caterpillar", "ok"),
+    ("Kohler", "ok"),
+    ("Generac", "ok"),
+    ("Custom Manufacturer Inc.", "ok"),
     # Invalid manufacturers - generic/placeholder values
-    state = AssetProcessingResult(**test_data)
-    check_manufacturer("To Be Determined", state)
-    assert state.ai_state["manufacturer"]["status"] == "generic"
-    
-    state = AssetProcessingResult(**test_data)
-    check_manufacturer("to be determined", state)
-    assert state.ai_state["manufacturer"]["status"] == "generic"
-    
-    state = AssetProcessingResult(**test_data)
-    check_manufacturer("TO BE DETERMINED", state)
-    assert state.ai_state["manufacturer"]["status"] == "generic"
-    
-    state = AssetProcessingResult(**test_data)
-    check_manufacturer("unknown", state)
-    assert state.ai_state["manufacturer"]["status"] == "generic"
-    
-    state = AssetProcessingResult(**test_data)
-    check_manufacturer("Unknown", state)
-    assert state.ai_state["manufacturer"]["status"] == "generic"
-    
-    state = AssetProcessingResult(**test_data)
-    check_manufacturer("UNKNOWN", state)
-    assert state.ai_state["manufacturer"]["status"] == "generic"
-    
+    ("To Be Determined", "generic"),
+    ("to be determined", "generic"),
+    ("TO BE DETERMINED", "generic"),
+    ("unknown", "generic"),
+    ("Unknown", "generic"),
+    ("UNKNOWN", "generic"),
     # Invalid manufacturers - empty/None
-    state = AssetProcessingResult(**test_data)
-    check_manufacturer("", state)
-    assert state.ai_state["manufacturer"]["status"] == "missing"
-    
-    state = AssetProcessingResult(**test_data)
-    check_manufacturer("   ", state)
-    assert state.ai_state["manufacturer"]["status"] == "missing"
+    ("", "missing"),
+    ("   ", "missing"),
+])
+def test_manufacturer_validation(manufacturer, expected):
+    """Test manufacturer validation with comprehensive edge cases"""
+    state = AssetProcessingResult()
+    check_manufacturer(manufacturer, state)
+    assert state.ai_state.manufacturer.status == expected
 
 
-def test_asset_classification_validation():
-    """Test asset classification validation with edge cases"""
-    from src.ai.mockservice import check_asset_classification, AssetProcessingResult
-    
-    test_data = {"asset_classification_guid2": "AC123", "asset_classification_name": "Test", "manufacturer_name": "Test", "model_number": "Test"}
-    
+@pytest.mark.parametrize("asset_classification,expected", [
     # Valid asset classifications
-    state = AssetProcessingResult(**test_data)
-    check_asset_classification("Generator (Diesel)", state)
-    assert state.ai_state["asset_classification"]["status"] == "ok"
-    
-    state = AssetProcessingResult(**test_data)
-    check_asset_classification("Generator Emissions/UREA/DPF Systems", state)
-    assert state.ai_state["asset_classification"]["status"] == "ok"
-    
-    state = AssetProcessingResult(**test_data)
-    check_asset_classification("Pump System", state)
-    assert state.ai_state["asset_classification"]["status"] == "ok"
-    
-    state = AssetProcessingResult(**test_data)
-    check_asset_classification("ABC", state)
-    assert state.ai_state["asset_classification"]["status"] == "ok"
-    
+    ("Generator (Diesel)", "ok"),
+    ("Generator Emissions/UREA/DPF Systems", "ok"),
+    ("Pump System", "ok"),
+    ("ABC", "ok"),
     # Invalid asset classifications - too short
-    state = AssetProcessingResult(**test_data)
-    check_asset_classification("AB", state)
-    assert state.ai_state["asset_classification"]["status"] == "invalid"
-    
-    state = AssetProcessingResult(**test_data)
-    check_asset_classification("A", state)
-    assert state.ai_state["asset_classification"]["status"] == "invalid"
-    
-    state = AssetProcessingResult(**test_data)
-    check_asset_classification("", state)
-    assert state.ai_state["asset_classification"]["status"] == "missing"
-    
-    state = AssetProcessingResult(**test_data)
-    check_asset_classification("  ", state)
-    assert state.ai_state["asset_classification"]["status"] == "missing"
-    
+    ("AB", "invalid"),
+    ("A", "invalid"),
+    ("", "missing"),
+    ("  ", "missing"),
     # Edge cases
-    state = AssetProcessingResult(**test_data)
-    check_asset_classification("   Generator   ", state)
-    assert state.ai_state["asset_classification"]["status"] == "ok"
+    ("   Generator   ", "ok"),
+])
+def test_asset_classification_validation(asset_classification, expected):
+    """Test asset classification validation with edge cases"""
+    state = AssetProcessingResult()
+    check_asset_classification(asset_classification, state)
+    assert state.ai_state.asset_classification.status == expected
 
-def test_model_number_validation():
-    """Test model number validation function"""
-    from src.ai.mockservice import check_model_number, AssetProcessingResult
-    
-    test_data = {"asset_classification_guid2": "AC123", "asset_classification_name": "Test", "manufacturer_name": "Test", "model_number": "Test"}
-    
+
+@pytest.mark.parametrize("model_number,expected", [
     # Valid model numbers
-    state = AssetProcessingResult(**test_data)
-    check_model_number("DQKAB-10679833", state)
-    assert state.ai_state["model_number"]["status"] == "ok"
-    
-    state = AssetProcessingResult(**test_data)
-    check_model_number("QSK19-G4", state)
-    assert state.ai_state["model_number"]["status"] == "ok"
-    
-    state = AssetProcessingResult(**test_data)
-    check_model_number("3516B", state)
-    assert state.ai_state["model_number"]["status"] == "ok"
-    
-    state = AssetProcessingResult(**test_data)
-    check_model_number("ABC123", state)
-    assert state.ai_state["model_number"]["status"] == "ok"
-    
+    ("DQKAB-10679833", "ok"),
+    ("QSK19-G4", "ok"),
+    ("3516B", "ok"),
+    ("ABC123", "ok"),
     # Invalid model numbers - too short
-    state = AssetProcessingResult(**test_data)
-    check_model_number("AB", state)
-    assert state.ai_state["model_number"]["status"] == "invalid"
-    
-    state = AssetProcessingResult(**test_data)
-    check_model_number("12", state)
-    assert state.ai_state["model_number"]["status"] == "invalid"
-    
-    state = AssetProcessingResult(**test_data)
-    check_model_number("", state)
-    assert state.ai_state["model_number"]["status"] == "missing"
-    
+    ("AB", "invalid"),
+    ("12", "invalid"),
+    ("", "missing"),
     # Invalid model numbers - generic patterns
-    state = AssetProcessingResult(**test_data)
-    check_model_number("450", state)
-    assert state.ai_state["model_number"]["status"] == "generic"
-    
-    state = AssetProcessingResult(**test_data)
-    check_model_number("500", state)
-    assert state.ai_state["model_number"]["status"] == "generic"
-    
-    state = AssetProcessingResult(**test_data)
-    check_model_number("600", state)
-    assert state.ai_state["model_number"]["status"] == "generic"
-    
-    state = AssetProcessingResult(**test_data)
-    check_model_number("1000", state)
-    assert state.ai_state["model_number"]["status"] == "generic"
-    
-    state = AssetProcessingResult(**test_data)
-    check_model_number("2000", state)
-    assert state.ai_state["model_number"]["status"] == "generic"
-    
-    state = AssetProcessingResult(**test_data)
-    check_model_number("generator", state)
-    assert state.ai_state["model_number"]["status"] == "generic"
-    
-    state = AssetProcessingResult(**test_data)
-    check_model_number("GENERATOR", state)
-    assert state.ai_state["model_number"]["status"] == "generic"
+    ("450", "generic"),
+    ("500", "generic"),
+    ("600", "generic"),
+    ("1000", "generic"),
+    ("2000", "generic"),
+    ("generator", "generic"),
+    ("GENERATOR", "generic"),
+])
+def test_model_number_validation(model_number, expected):
+    """Test model number validation function"""
+    state = AssetProcessingResult()
+    check_model_number(model_number, state)
+    assert state.ai_state.model_number.status == expected
 
 
 def test_validation_functions_integration():
     """Test how validation functions work together"""
-    from src.ai.mockservice import check_manufacturer, check_asset_classification, check_model_number, AssetProcessingResult
-    
-    test_data = {"asset_classification_guid2": "AC123", "asset_classification_name": "Test", "manufacturer_name": "Test", "model_number": "Test"}
     
     # All valid data scenario
-    state = AssetProcessingResult(**test_data)
+    state = AssetProcessingResult()
     check_manufacturer("Cummins", state)
     check_asset_classification("Generator (Diesel)", state)
     check_model_number("DQKAB-10679833", state)
     
-    assert state.ai_state["manufacturer"]["status"] == "ok"
-    assert state.ai_state["asset_classification"]["status"] == "ok"
-    assert state.ai_state["model_number"]["status"] == "ok"
+    assert state.ai_state.manufacturer.status == "ok"
+    assert state.ai_state.asset_classification.status == "ok"
+    assert state.ai_state.model_number.status == "ok"
     assert state.is_valid() == True
     
     # Mixed valid/invalid data scenarios
-    state = AssetProcessingResult(**test_data)
+    state = AssetProcessingResult()
     check_manufacturer("To Be Determined", state)
     check_asset_classification("Generator (Diesel)", state)
     check_model_number("DQKAB-10679833", state)
     
-    assert state.ai_state["manufacturer"]["status"] == "generic"
-    assert state.ai_state["asset_classification"]["status"] == "ok"
-    assert state.ai_state["model_number"]["status"] == "ok"
+    assert state.ai_state.manufacturer.status == "generic"
+    assert state.ai_state.asset_classification.status == "ok"
+    assert state.ai_state.model_number.status == "ok"
     assert state.is_valid() == False  # Should be invalid due to manufacturer
     
     # All invalid data
-    state = AssetProcessingResult(**test_data)
+    state = AssetProcessingResult()
     check_manufacturer("", state)
     check_asset_classification("", state)
     check_model_number("450", state)
     
-    assert state.ai_state["manufacturer"]["status"] == "missing"
-    assert state.ai_state["asset_classification"]["status"] == "missing"
-    assert state.ai_state["model_number"]["status"] == "generic"
+    assert state.ai_state.manufacturer.status == "missing"
+    assert state.ai_state.asset_classification.status == "missing"
+    assert state.ai_state.model_number.status == "generic"
     assert state.is_valid() == False
 
 
 
 def test_asset_processing_result_initialization():
     """Test AssetProcessingResult initialization and basic functionality"""
-    from src.ai.mockservice import AssetProcessingResult
     
-    # Test initialization with data
-    data = {
-        "asset_classification_guid2": "AC0583",
-        "asset_classification_name": "Generator (Diesel)", 
-        "manufacturer_name": "Cummins",
-        "model_number": "DQKAB-10679833"
-    }
-    state = AssetProcessingResult(**data)
+    state = AssetProcessingResult()
     
-    # Check that ai_state is initialized as empty dict
-    assert state.ai_state == {}
+    # Check that ai_state is initialized empty
+    assert state.ai_state == ValidationStates()
     assert state.is_valid() == True  # No failed validations yet
 
 def test_asset_processing_result_insert_and_retrieval():
     """Test inserting and retrieving state information"""
-    from src.ai.mockservice import AssetProcessingResult
     
-    data = {
-        "asset_classification_guid2": "AC0583",
-        "asset_classification_name": "Generator (Diesel)",
-        "manufacturer_name": "Cummins", 
-        "model_number": "DQKAB-10679833"
-    }
-    state = AssetProcessingResult(**data)
+    state = AssetProcessingResult()
     
     # Insert valid state
     state.insert_state("manufacturer", "ok", "Valid manufacturer provided", value="Cummins")
-    assert state.ai_state["manufacturer"]["status"] == "ok"
-    assert state.ai_state["manufacturer"]["reason"] == "Valid manufacturer provided"
-    assert state.ai_state["manufacturer"]["value"] == "Cummins"
+    assert state.ai_state.manufacturer.status == "ok"
+    assert state.ai_state.manufacturer.reason == "Valid manufacturer provided"
+    assert state.ai_state.manufacturer.value == "Cummins"
     
     # Insert invalid state
     state.insert_state("model_number", "generic", "Model number too generic", value="450")
-    assert state.ai_state["model_number"]["status"] == "generic"
-    assert state.ai_state["model_number"]["reason"] == "Model number too generic"
-    assert state.ai_state["model_number"]["value"] == "450"
+    assert state.ai_state.model_number.status == "generic"
+    assert state.ai_state.model_number.reason == "Model number too generic"
+    assert state.ai_state.model_number.value == "450"
 
 def test_asset_processing_result_failed_validations():
     """Test get_failed_validations functionality"""
-    from src.ai.mockservice import AssetProcessingResult
     
-    data = {
-        "asset_classification_guid2": "AC0583",
-        "asset_classification_name": "Generator (Diesel)",
-        "manufacturer_name": "Cummins",
-        "model_number": "DQKAB-10679833"
-    }
-    state = AssetProcessingResult(**data)
+    state = AssetProcessingResult()
     
     # Add mix of valid and invalid states
     state.insert_state("manufacturer", "ok", "Valid manufacturer", value="Cummins")
@@ -323,20 +205,13 @@ def test_asset_processing_result_failed_validations():
     assert "manufacturer" not in failed
     assert "model_number" in failed
     assert "asset_classification" in failed
-    assert failed["model_number"]["status"] == "generic"
-    assert failed["asset_classification"]["status"] == "missing"
+    assert failed["model_number"].status == "generic"
+    assert failed["asset_classification"].status == "missing"
 
 def test_asset_processing_result_is_valid():
     """Test is_valid method"""
-    from src.ai.mockservice import AssetProcessingResult
     
-    data = {
-        "asset_classification_guid2": "AC0583",
-        "asset_classification_name": "Generator (Diesel)",
-        "manufacturer_name": "Cummins",
-        "model_number": "DQKAB-10679833"
-    }
-    state = AssetProcessingResult(**data)
+    state = AssetProcessingResult()
     
     # Empty state should be valid
     assert state.is_valid() == True
@@ -350,39 +225,43 @@ def test_asset_processing_result_is_valid():
     state.insert_state("asset_classification", "missing", "Missing", value="")
     assert state.is_valid() == False
 
+def test_is_valid_agrees_with_failed_validations():
+    """Test the generated explanation counts neither as valid nor as failed"""
+    state = AssetProcessingResult()
+    state.insert_state("manufacturer", "ok", "Valid", value="Cummins")
+    state.insert_state("model_number", "ok", "Valid", value="QSK60")
+    state.insert_state("product_line", "ok", "Found", value="QSK Series")
+    state.generate_explanation()
+
+    assert state.ai_state.explanation.status == "generated"
+    assert state.is_valid() == True
+    assert state.get_failed_validations() == {}
+
 def test_asset_processing_result_clear():
     """Test clearing state"""
-    from src.ai.mockservice import AssetProcessingResult
     
-    data = {
-        "asset_classification_guid2": "AC0583",
-        "asset_classification_name": "Generator (Diesel)",
-        "manufacturer_name": "Cummins",
-        "model_number": "DQKAB-10679833"
-    }
-    state = AssetProcessingResult(**data)
+    state = AssetProcessingResult()
     
     # Add some state
     state.insert_state("manufacturer", "ok", "Valid", value="Cummins")
     state.insert_state("model_number", "generic", "Too generic", value="450")
-    assert len(state.ai_state) == 2
+    assert state.ai_state.manufacturer.status == "ok"
+    assert state.ai_state.model_number.status == "generic"
     
     # Clear and verify
     state.clear_ai_state()
-    assert state.ai_state == {}
+    assert state.ai_state == ValidationStates()
     assert state.is_valid() == True
 
 
 
 
 def test_bad_mock_service(mock_input_bad):
-    from src.ai.mockservice import MockService
     service = MockService()
     service.process_asset_data(mock_input_bad)
 
 def test_integration_process_asset_data_valid():
     """Test process_asset_data with valid data"""
-    from src.ai.mockservice import MockService
     
     valid_data = {
         "asset_classification_guid2": "AC0583",
@@ -403,13 +282,12 @@ def test_integration_process_asset_data_valid():
     
     # Check specific validation states
     ai_state = result.get_ai_state()
-    assert ai_state["manufacturer"]["status"] == "ok"
-    assert ai_state["asset_classification"]["status"] == "ok"
-    assert ai_state["model_number"]["status"] == "ok"
+    assert ai_state.manufacturer.status == "ok"
+    assert ai_state.asset_classification.status == "ok"
+    assert ai_state.model_number.status == "ok"
 
 def test_integration_process_asset_data_invalid():
     """Test process_asset_data with invalid data"""
-    from src.ai.mockservice import MockService
     
     invalid_data = {
         "asset_classification_guid2": "AC0584",
@@ -425,19 +303,69 @@ def test_integration_process_asset_data_invalid():
     assert result is not None
     assert hasattr(result, 'ai_state')
     
-    # Check that validation failed overall
-    assert result.is_valid() == False
-    
-    # Check that all failed validations are captured
-    failed = result.get_failed_validations()
-    assert len(failed) == 3  # All three should fail
-    
-    assert "manufacturer" in failed
-    assert failed["manufacturer"]["status"] == "generic"
-    
-    assert "asset_classification" in failed
-    assert failed["asset_classification"]["status"] == "missing"
-    
-    assert "model_number" in failed
-    assert failed["model_number"]["status"] == "generic"
+    # Every failed field is enriched from Salesforce, which marks it as ok
+    ai_state = result.get_ai_state()
+    for field_name in ("manufacturer", "asset_classification", "model_number"):
+        state = getattr(ai_state, field_name)
+        assert state.status == "ok"
+        assert state.reason.startswith("Enriched via Salesforce")
+        assert state.value
+
+    # Product line is re-detected from the enriched model, which may not yield one
+    assert set(result.get_failed_validations()) <= {"product_line"}
+    assert ai_state.explanation.status == "generated"
+
+def test_match_caches_response(mock_input_good):
+    """Test match returns a MatchResponse and serves repeats from the cache"""
+
+    service = MockService()
+    response = service.match(mock_input_good)
+
+    assert isinstance(response, MatchResponse)
+    assert response.product_line == "DQKAB"
+    assert service.match(mock_input_good) is response
+
+def test_product_line_detection():
+    """Test product line detection prefers the first declared pattern"""
+
+    service = MockService()
 
+    state = AssetProcessingResult()
+    service._get_product_line("Cummins", "NT855-KTA", state)
+    assert state.ai_state.product_line.value == "KTA"
+
+    state = AssetProcessingResult()
+    service._get_product_line("Caterpillar", "C15-ACERT", state)
+    assert state.ai_state.product_line.value == "C15"
+
+    # Unknown manufacturer falls back to the model prefix
+    state = AssetProcessingResult()
+    service._get_product_line("Generac", "SG150-X", state)
+    assert state.ai_state.product_line.value == "SG15"
+
+def test_match_skips_cache_for_missing_fields():
+    """Test inputs without a manufacturer or model number are not cached"""
+
+    service = MockService()
+    service.match({"asset_classification_name": "Generator", "manufacturer_name": "", "model_number": "DQKAB-1"})
+    service.match({"asset_classification_name": "Generator", "manufacturer_name": "Cummins", "model_number": "  "})
+
+    assert len(service.response_cache.cache) == 0
+
+def test_match_normalizes_manufacturer_once():
+    """Test padded input picks the same product line and explanation as clean input"""
+
+    service = MockService()
+    response = service.match({
+        "asset_classification_name": "Generator (Diesel)",
+        "manufacturer_name": " cummins ",
+        "model_number": "NT855-KTA"
+    })
+
+    assert response.product_line == "KTA"
+    assert "manufactured by Cummins" in response.explanation
+    assert service.match({
+        "asset_classification_name": "Generator (Diesel)",
+        "manufacturer_name": "Cummins",
+        "model_number": "NT855-KTA"
+    }) is response
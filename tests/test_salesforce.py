@@ -0,0 +1,127 @@
+import json
+
+import pytest
+
+from src.ai.mockservice import MockService
+from src.salesforce import salesforce
+from src.salesforce.salesforce import SalesForceService, prewarm_enrichment
+
+
+@pytest.fixture
+def failed_validations():
+    return {
+        "manufacturer": {"status": "generic"},
+        "model_number": {"status": "generic"},
+        "product_line": {"status": "not_found"},
+    }
+
+
+@pytest.fixture
+def prewarm_calls(monkeypatch):
+    """Reset the prewarm guard and record every enrichment the prewarm runs"""
+    calls = []
+    original = SalesForceService.enrich_failed_validations
+
+    def recording(self, failed_validations):
+        calls.append(failed_validations)
+        return original(self, failed_validations)
+    monkeypatch.setattr(salesforce, "_prewarmed", False)
+    monkeypatch.setattr(SalesForceService, "enrich_failed_validations", recording)
+    return calls
+
+
+def test_enrich_failed_validations(failed_validations):
+    """Test every failed field is enriched and summarized"""
+    service = SalesForceService()
+    result = service.enrich_failed_validations(failed_validations)
+
+    assert set(result["enriched_data"]) == set(failed_validations)
+    assert result["summary"]["fields_enriched"] == 3
+    assert result["summary"]["avg_confidence"] == pytest.approx((0.95 + 0.88 + 0.92) / 3)
+
+
+def test_enrich_fields_only_requested():
+    """Test enrich_fields only looks up the requested fields"""
+    service = SalesForceService()
+    enriched = service.enrich_fields(["manufacturer"])
+
+    assert list(enriched) == ["manufacturer"]
+    assert enriched["manufacturer"].source == "Salesforce Vendor Master"
+
+
+def test_create_enriched_match_request(failed_validations):
+    """Test enriched request uses enrichments and falls back to 'Unknown'"""
+    service = SalesForceService()
+    request = service.create_enriched_match_request(failed_validations)
+
+    assert request["manufacturer_name"] != "Unknown"
+    assert request["model_number"] != "Unknown"
+    assert request["asset_classification_name"] == "Unknown"
+    assert request["asset_classification_guid2"] == "AC_ENRICHED"
+
+
+def test_shared_service_enriches_per_call(failed_validations):
+    """Test the long-lived service on MockService enriches whatever each call passes"""
+    service = MockService()._salesforce
+
+    request = service.create_enriched_match_request(failed_validations)
+    assert request["manufacturer_name"] != "Unknown"
+    assert request["model_number"] != "Unknown"
+
+    request = service.create_enriched_match_request({"asset_classification": {"status": "missing"}})
+    assert request["manufacturer_name"] == "Unknown"
+    assert request["asset_classification_name"] != "Unknown"
+
+
+def test_unknown_field_returns_shared_empty_enrichment():
+    """Test unknown fields share one read-only empty enrichment"""
+    service = SalesForceService()
+    first = service.lookup_enrichment("serial_number")
+
+    assert first is service.lookup_enrichment("other_field")
+    assert first.source == "Unknown"
+    with pytest.raises(TypeError):
+        first.additional_data["key"] = "value"
+
+
+def test_enrichment_as_dict():
+    """Test Enrichment converts back to the plain dict form"""
+    enrichment = SalesForceService().lookup_enrichment("manufacturer")
+    data = enrichment.as_dict()
+
+    assert data["enhanced_value"] == enrichment.enhanced_value
+    assert data["confidence"] == 0.95
+    assert data["additional_data"]["support_level"] == "Premium"
+
+    # Every field's dict form must survive a JSON round trip
+    service = SalesForceService()
+    for field_name in ("manufacturer", "asset_classification", "model_number", "product_line"):
+        data = service.lookup_enrichment(field_name).as_dict()
+        assert json.loads(json.dumps(data)) == data
+
+
+def test_explanation_lists_sources_in_field_order(failed_validations):
+    """Test the summary explanation lists each source once, in field order"""
+    service = SalesForceService()
+    explanation = service.enrich_failed_validations(failed_validations)["summary"]["explanation"]
+
+    assert "using Salesforce Vendor Master, Salesforce Technical Specifications, Salesforce Product Catalog with" in explanation
+
+
+
+def test_prewarm_runs_once(monkeypatch, prewarm_calls):
+    """Test the prewarm guard only enriches on the first call"""
+    monkeypatch.delenv("SALESFORCE_PREWARM", raising=False)
+    prewarm_enrichment()
+    MockService()
+
+    assert len(prewarm_calls) == 1
+    assert set(prewarm_calls[0]) == {"manufacturer", "asset_classification", "model_number", "product_line"}
+
+
+def test_prewarm_disabled(monkeypatch, prewarm_calls):
+    """Test SALESFORCE_PREWARM=0 skips the prewarm even when MockService is created"""
+    monkeypatch.setenv("SALESFORCE_PREWARM", "0")
+    MockService()
+
+    assert prewarm_calls == []